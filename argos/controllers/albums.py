@@ -7,7 +7,7 @@ if TYPE_CHECKING:
 
 from argos.controllers.base import ControllerBase
 from argos.controllers.utils import parse_tracks
-from argos.controllers.visitors import AlbumMetadataCollector, LengthAcc
+from argos.controllers.visitors import AlbumMetadataCollector
 from argos.info import InformationService
 from argos.message import Message, MessageType, consume
 
@@ -49,15 +49,16 @@ class AlbumsController(ControllerBase):
         if album_tracks_dto is None or len(album_tracks_dto) == 0:
             return
 
-        length_acc = LengthAcc()
         metadata_collector = AlbumMetadataCollector()
-        parsed_tracks = parse_tracks(
-            tracks_dto, visitors=[length_acc, metadata_collector]
-        ).get(album_uri, [])
+        parsed_tracks = parse_tracks(tracks_dto, visitors=[metadata_collector]).get(
+            album_uri, []
+        )
 
         parsed_tracks.sort(key=attrgetter("disc_no", "track_no"))
 
-        length = length_acc.length[album_uri]
+        lengths = [t.length for t in parsed_tracks]
+        length = sum(lengths) if -1 not in lengths else -1
+        # Track models have length -1 when unknown
         artist_name = metadata_collector.artist_name(album_uri)
         num_tracks = metadata_collector.num_tracks(album_uri)
         num_discs = metadata_collector.num_discs(album_uri)
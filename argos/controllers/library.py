@@ -32,6 +32,7 @@ LOGGER = logging.getLogger(__name__)
 
 _ = gettext.gettext
 
+_MAX_CONCURRENT_IMAGES_CALLS = 8
 
 _DIRECTORY_NAMES = {
     "Files": _("Files"),
@@ -299,6 +300,7 @@ class LibraryController(ControllerBase):
         images = await call_by_slice(
             self._http.get_images,
             params=album_uris,
+            max_concurrent_calls=_MAX_CONCURRENT_IMAGES_CALLS,
         )
         if images is None:
             LOGGER.warning("Failed to fetch URIs of images")
@@ -319,17 +321,15 @@ class LibraryController(ControllerBase):
                 directory_tracks_dto, visitors=[length_acc, metadata_collector]
             )
 
+        get_image_filepath = self._download.get_image_filepath
         parsed_albums: List[AlbumModel] = []
         for album_dto in album_dtos:
             album_uri = album_dto.uri
 
-            if (
-                images is not None
-                and album_uri in images
-                and len(images[album_uri]) > 0
-            ):
-                image_uri = images[album_uri][0].uri
-                filepath = self._download.get_image_filepath(image_uri)
+            album_images = images.get(album_uri) if images is not None else None
+            if album_images:
+                image_uri = album_images[0].uri
+                filepath = get_image_filepath(image_uri)
             else:
                 image_uri = ""
                 filepath = None
@@ -377,21 +377,20 @@ class LibraryController(ControllerBase):
         images = await call_by_slice(
             self._http.get_images,
             params=subdir_uris,
+            max_concurrent_calls=_MAX_CONCURRENT_IMAGES_CALLS,
         )
         if images is None:
             LOGGER.warning("Failed to fetch URIs of images")
 
+        get_image_filepath = self._download.get_image_filepath
         subdirs: List[DirectoryModel] = []
         for subdir_dto in subdir_dtos:
             subdir_uri = subdir_dto.uri
 
-            if (
-                images is not None
-                and subdir_uri in images
-                and len(images[subdir_uri]) > 0
-            ):
-                image_uri = images[subdir_uri][0].uri
-                filepath = self._download.get_image_filepath(image_uri)
+            subdir_images = images.get(subdir_uri) if images is not None else None
+            if subdir_images:
+                image_uri = subdir_images[0].uri
+                filepath = get_image_filepath(image_uri)
             else:
                 image_uri = ""
                 filepath = None
@@ -432,21 +431,21 @@ class LibraryController(ControllerBase):
         images = await call_by_slice(
             self._http.get_images,
             params=track_uris,
+            max_concurrent_calls=_MAX_CONCURRENT_IMAGES_CALLS,
         )
         if images is None:
             LOGGER.warning("Failed to fetch URIs of images")
 
         LOGGER.debug("Parsing tracks")
+        get_image_filepath = self._download.get_image_filepath
         parsed_tracks: List[TrackModel] = []
         for tracks in parse_tracks(directory_tracks_dto).values():
             for track in tracks:
-                track_uri = track.uri
-                if images is not None and len(images.get(track_uri, [])) > 0:
-                    image_uri = images[track_uri][0].uri
+                track_images = images.get(track.uri) if images is not None else None
+                if track_images:
+                    image_uri = track_images[0].uri
                     track.props.image_uri = image_uri
-                    track.props.image_path = self._download.get_image_filepath(
-                        image_uri
-                    )
+                    track.props.image_path = get_image_filepath(image_uri)
 
                 parsed_tracks.append(track)
 
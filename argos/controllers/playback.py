@@ -182,7 +182,7 @@ class PlaybackController(ControllerBase):
         artist_name = track.artist_name
         album_name = track.album_name
         summary = _("Started to play {}").format(track_name)
-        body = ", ".join(filter(lambda s: s, [artist_name, album_name]))
+        body = ", ".join(filter(None, (artist_name, album_name)))
         self._notifier.send_notification(
             summary, body=body, invisible_playing_page=True, is_playing=True
         )
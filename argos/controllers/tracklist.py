@@ -32,20 +32,12 @@ class TracklistController(ControllerBase):
     )
     async def get_options(self, message: Message) -> None:
         consume = await self._http.get_consume()
-        if consume is not None:
-            self._model.tracklist.set_consume(consume)
-
         random = await self._http.get_random()
-        if random is not None:
-            self._model.tracklist.set_random(random)
-
         repeat = await self._http.get_repeat()
-        if repeat is not None:
-            self._model.tracklist.set_repeat(repeat)
-
         single = await self._http.get_single()
-        if single is not None:
-            self._model.tracklist.set_single(single)
+        self._model.tracklist.set_options(
+            consume=consume, random=random, repeat=repeat, single=single
+        )
 
     @consume(MessageType.ADD_TO_TRACKLIST)
     async def add_to_tracklist(self, message: Message) -> None:
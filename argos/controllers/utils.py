@@ -1,3 +1,4 @@
+import asyncio
 import logging
 from collections import defaultdict
 from typing import Any, Callable, Coroutine, Dict, List, Mapping, Optional, Sequence
@@ -16,13 +17,18 @@ async def call_by_slice(
     *,
     params: List[str],
     call_size: Optional[int] = None,
+    max_concurrent_calls: Optional[int] = None,
     notifier: Optional[ProgressNotifierProtocol] = None,
 ) -> Dict[str, Any]:
-    """Make multiple synchronous calls.
+    """Make multiple calls.
 
     The argument ``params`` is split in slices of bounded
     length. There's one ``func`` call per slice.
 
+    Calls are sequential unless ``max_concurrent_calls`` is greater
+    than one. Return values are merged in slices order, and merging
+    stops at the first call returning ``None``.
+
     Args:
         func: Callable that will be called.
 
@@ -30,6 +36,9 @@ async def call_by_slice(
 
         call_size: Number of parameters to handle through each call.
 
+        max_concurrent_calls: Maximal number of calls running
+            simultaneously.
+
         notifier: Progress notifier to call on each iteration
 
     Returns:
@@ -40,12 +49,36 @@ async def call_by_slice(
     call_count = len(params) // call_size + (0 if len(params) % call_size == 0 else 1)
     result: Dict[str, Any] = {}
     step = 0
-    for i in range(call_count):
-        params_slice = params[i * call_size : (i + 1) * call_size]
-        ith_result = await func(params_slice)
+
+    if max_concurrent_calls is None or max_concurrent_calls <= 1:
+        for i in range(call_count):
+            params_slice = params[i * call_size : (i + 1) * call_size]
+            ith_result = await func(params_slice)
+            if notifier is not None:
+                step += len(params_slice)
+                notifier(step)
+            if ith_result is None:
+                break
+            result.update(ith_result)
+        return result
+
+    semaphore = asyncio.Semaphore(max_concurrent_calls)
+
+    async def call(params_slice: List[str]) -> Optional[Dict[str, Any]]:
+        nonlocal step
+
+        async with semaphore:
+            ith_result = await func(params_slice)
+
         if notifier is not None:
             step += len(params_slice)
             notifier(step)
+        return ith_result
+
+    results = await asyncio.gather(
+        *(call(params[i * call_size : (i + 1) * call_size]) for i in range(call_count))
+    )
+    for ith_result in results:
         if ith_result is None:
             break
         result.update(ith_result)
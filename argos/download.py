@@ -1,9 +1,8 @@
 import asyncio
 import logging
 import urllib.parse
-from functools import partial
 from pathlib import Path
-from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Set, Tuple
 
 import aiohttp
 import xdg.BaseDirectory  # type: ignore
@@ -101,7 +100,19 @@ class ImageDownloader(GObject.GObject):
         return filepath
 
     async def fetch_images(self, image_uris: List[str]) -> None:
-        """Fetch the image files."""
+        """Fetch the image files.
+
+        Duplicated and empty URIs are ignored.
+
+        """
+        unique_image_uris: List[str] = []
+        seen: Set[str] = set()
+        for image_uri in image_uris:
+            if image_uri and image_uri not in seen:
+                seen.add(image_uri)
+                unique_image_uris.append(image_uri)
+        image_uris = unique_image_uris
+
         if len(image_uris) == 0:
             return None
 
@@ -122,10 +133,8 @@ class ImageDownloader(GObject.GObject):
 
             LOGGER.info("Images have been downloaded")
             GLib.idle_add(
-                partial(
-                    self.emit,
-                    "images-downloaded",
-                )
+                self.emit,
+                "images-downloaded",
             )
 
         if self._ongoing_task:
@@ -1,6 +1,6 @@
 import locale
 import logging
-from typing import Callable, List, Optional, Set
+from typing import Callable, Dict, List, Optional, Set
 
 from gi.repository import Gio, GObject
 
@@ -54,6 +54,21 @@ class DirectoryModel(GObject.Object):
         self.tracks = Gio.ListStore.new(TrackModel)
         self.playlists = Gio.ListStore.new(PlaylistModel)
 
+        self._albums_by_uri: Dict[str, AlbumModel] = {}
+        # Index of albums by URI, rebuilt in the main thread each time
+        # albums change. The index is fully rebuilt on each
+        # items-changed signal, thus albums must be added at once (eg
+        # using splice()) instead of one by one
+        self.albums.connect("items-changed", self._on_albums_changed)
+
+    def _on_albums_changed(self, _1: Gio.ListModel, _2: int, _3: int, _4: int) -> None:
+        albums_by_uri: Dict[str, AlbumModel] = {}
+        for album in self.albums:
+            albums_by_uri.setdefault(album.props.uri, album)
+            # First album wins on duplicated URIs
+
+        self._albums_by_uri = albums_by_uri
+
     def sort_albums(
         self,
         compare_func: Callable[[AlbumModel, AlbumModel, None], int],
@@ -102,9 +117,9 @@ class DirectoryModel(GObject.Object):
                 # doesn't match
                 return None
 
-        for album in self.albums:
-            if album.props.uri == uri:
-                return album
+        found_album = self._albums_by_uri.get(uri)
+        if found_album is not None:
+            return found_album
 
         for directory in self.directories:
             found = directory.get_album(uri)
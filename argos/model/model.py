@@ -2,8 +2,18 @@ import logging
 import random
 import threading
 from datetime import datetime
-from functools import partial
-from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional, Sequence, Tuple
+from functools import cmp_to_key
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Dict,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    TypeVar,
+)
 
 from gi.repository import Gio, GLib, GObject
 
@@ -36,6 +46,12 @@ if TYPE_CHECKING:
 
 LOGGER = logging.getLogger(__name__)
 
+T = TypeVar("T")
+
+
+def _sorted(items: Sequence[T], compare_func: Callable[[T, T, None], int]) -> List[T]:
+    return sorted(items, key=cmp_to_key(lambda a, b: compare_func(a, b, None)))
+
 
 class Model(WithThreadSafePropertySetter, GObject.Object):
     __gsignals__: Dict[str, Tuple[int, Any, Sequence]] = {
@@ -158,32 +174,30 @@ class Model(WithThreadSafePropertySetter, GObject.Object):
         else:
             event = None
 
+        album_sort_id = self._settings.get_string("album-sort")
+        album_compare_func = self._get_album_compare_func(album_sort_id)
+        sorted_albums = _sorted(albums, album_compare_func)
+        sorted_directories = _sorted(directories, compare_directories_func)
+        sorted_playlists = _sorted(playlists, compare_playlists_func)
+        sorted_tracks = _sorted(tracks, compare_tracks_by_name_func)
+        # Sort in calling thread, only stores update is done in the
+        # main thread
+
         def _complete_directory():
             directory = self.get_directory(uri)
             if directory is not None:
-                directory.albums.remove_all()
-                directory.directories.remove_all()
-                directory.playlists.remove_all()
-                directory.tracks.remove_all()
-
-                album_sort_id = self._settings.get_string("album-sort")
-                album_compare_func = self._get_album_compare_func(album_sort_id)
-                for album in albums:
-                    directory.albums.insert_sorted(album, album_compare_func, None)
-
-                for subdir in directories:
-                    directory.directories.insert_sorted(
-                        subdir, compare_directories_func, None
-                    )
-
-                for playlist in playlists:
-                    directory.playlists.insert_sorted(
-                        playlist, compare_playlists_func, None
-                    )
-
-                for track in tracks:
-                    directory.tracks.insert_sorted(
-                        track, compare_tracks_by_name_func, None
+                for store, items in [
+                    (directory.albums, sorted_albums),
+                    (directory.directories, sorted_directories),
+                    (directory.playlists, sorted_playlists),
+                    (directory.tracks, sorted_tracks),
+                ]:
+                    store.splice(0, store.get_n_items(), items)
+
+                current_album_sort_id = self._settings.get_string("album-sort")
+                if current_album_sort_id != album_sort_id:
+                    directory.albums.sort(
+                        self._get_album_compare_func(current_album_sort_id), None
                     )
             else:
                 LOGGER.debug(f"Won't complete unknown directory with URI {uri}")
@@ -209,17 +223,15 @@ class Model(WithThreadSafePropertySetter, GObject.Object):
         tracks: List[TrackModel],
     ) -> None:
         GLib.idle_add(
-            partial(
-                self._complete_album_description,
-                uri,
-                artist_name,
-                num_tracks,
-                num_discs,
-                date,
-                last_modified,
-                length,
-                tracks,
-            )
+            self._complete_album_description,
+            uri,
+            artist_name,
+            num_tracks,
+            num_discs,
+            date,
+            last_modified,
+            length,
+            tracks,
         )
 
     def _complete_album_description(
@@ -251,11 +263,9 @@ class Model(WithThreadSafePropertySetter, GObject.Object):
             album.tracks.append(track)
 
         GLib.idle_add(
-            partial(
-                self.emit,
-                "album-completed",
-                uri,
-            )
+            self.emit,
+            "album-completed",
+            uri,
         )
 
     def set_album_information(
@@ -295,11 +305,9 @@ class Model(WithThreadSafePropertySetter, GObject.Object):
         self, version: Optional[int], tl_tracks: Sequence[TracklistTrackModel]
     ) -> None:
         GLib.idle_add(
-            partial(
-                self._update_tracklist,
-                version,
-                tl_tracks,
-            )
+            self._update_tracklist,
+            version,
+            tl_tracks,
         )
 
     def _update_tracklist(
@@ -325,10 +333,8 @@ class Model(WithThreadSafePropertySetter, GObject.Object):
 
     def update_playlists(self, playlists: Sequence[PlaylistModel]) -> None:
         GLib.idle_add(
-            partial(
-                self._update_playlists,
-                playlists,
-            )
+            self._update_playlists,
+            playlists,
         )
 
     def _update_playlists(self, playlists: Sequence[PlaylistModel]) -> None:
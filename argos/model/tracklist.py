@@ -1,4 +1,4 @@
-from typing import Optional
+from typing import Any, Dict, Optional
 
 from gi.repository import Gio, GObject
 
@@ -42,17 +42,28 @@ class TracklistModel(WithThreadSafePropertySetter, GObject.Object):
         super().__init__(**kwargs)
         self.tracks = Gio.ListStore.new(TracklistTrackModel)
 
-    def set_consume(self, value: bool) -> None:
-        self.set_property_in_gtk_thread("consume", value)
-
-    def set_random(self, value: bool) -> None:
-        self.set_property_in_gtk_thread("random", value)
-
-    def set_repeat(self, value: bool) -> None:
-        self.set_property_in_gtk_thread("repeat", value)
-
-    def set_single(self, value: bool) -> None:
-        self.set_property_in_gtk_thread("single", value)
+    def set_options(
+        self,
+        *,
+        consume: Optional[bool] = None,
+        random: Optional[bool] = None,
+        repeat: Optional[bool] = None,
+        single: Optional[bool] = None,
+    ) -> None:
+        """Set tracklist options at once.
+
+        Options with value ``None`` are left unchanged.
+
+        """
+        options: Dict[str, Any] = {
+            "consume": consume,
+            "random": random,
+            "repeat": repeat,
+            "single": single,
+        }
+        self.set_properties_in_gtk_thread(
+            {name: value for name, value in options.items() if value is not None}
+        )
 
     def set_version(self, value: int) -> None:
         self.set_property_in_gtk_thread("version", value)
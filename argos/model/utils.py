@@ -1,7 +1,7 @@
 import contextlib
 import logging
 from enum import IntEnum
-from typing import Any, ContextManager, Optional, Protocol
+from typing import Any, ContextManager, Dict, Optional, Protocol
 
 from gi.repository import GLib
 
@@ -58,6 +58,37 @@ class WithThreadSafePropertySetter:
         else:
             LOGGER.debug(f"Property {name!r} already equal to {value!r}")
 
+    def set_properties_in_gtk_thread(
+        self: HasPropertiesProtocol,
+        values: Dict[str, Any],
+    ) -> None:
+        """Set multiple properties through a single main loop iteration.
+
+        Properties already equal to the expected value are skipped.
+
+        """
+        changed_values = {
+            name: value
+            for name, value in values.items()
+            if self.get_property(name) != value
+        }
+        if len(changed_values) == 0:
+            LOGGER.debug(f"Properties {list(values)!r} already up-to-date")
+            return
+
+        def wrapped_setter() -> None:
+            for name, value in changed_values.items():
+                current_value = self.get_property(name)
+                if current_value != value:
+                    LOGGER.debug(
+                        f"Updating {name!r} from {current_value!r} to {value!r}"
+                    )
+                    self.set_property(name, value)
+                else:
+                    LOGGER.debug(f"Property {name!r} already equal to {value!r}")
+
+        GLib.idle_add(wrapped_setter)
+
 
 class PlaybackState(IntEnum):
     UNKNOWN = 0
@@ -67,13 +98,15 @@ class PlaybackState(IntEnum):
 
     @staticmethod
     def from_string(value: str) -> "PlaybackState":
-        if value == "playing":
-            state = PlaybackState.PLAYING
-        elif value == "paused":
-            state = PlaybackState.PAUSED
-        elif value == "stopped":
-            state = PlaybackState.STOPPED
-        else:
-            state = PlaybackState.UNKNOWN
+        state = _PLAYBACK_STATES.get(value)
+        if state is None:
             LOGGER.error(f"Unexpected state {value!r}")
+            return PlaybackState.UNKNOWN
         return state
+
+
+_PLAYBACK_STATES: Dict[str, PlaybackState] = {
+    "playing": PlaybackState.PLAYING,
+    "paused": PlaybackState.PAUSED,
+    "stopped": PlaybackState.STOPPED,
+}
@@ -1,24 +1,32 @@
 import logging
+import os
 import queue
 import re
 import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from enum import IntEnum
 from pathlib import Path
-from typing import List, Optional, Tuple, Union
+from typing import List, Optional, Set, Tuple, Union
 
-from gi.repository import Gio, GLib, GObject, Gtk
+from gi.repository import Gdk, Gio, GLib, GObject, Gtk
 from gi.repository.GdkPixbuf import Pixbuf
 
 from argos.model import AlbumModel, DirectoryModel, Model, PlaylistModel, TrackModel
-from argos.utils import elide_maybe
 from argos.widgets.albumdetailsbox import AlbumDetailsBox
 from argos.widgets.condensedplayingbox import CondensedPlayingBox
 from argos.widgets.librarybrowsingprogressbox import LibraryBrowsingProgressBox
 from argos.widgets.tracksview import TracksView
-from argos.widgets.utils import default_image_pixbuf, scale_album_image
+from argos.widgets.utils import (
+    default_image_pixbuf,
+    elide_and_escape_markup,
+    escape_markup,
+    scale_album_image,
+)
 
 LOGGER = logging.getLogger(__name__)
 
+PIXBUFS_UPDATE_DELAY = 100  # ms
+
 
 class DirectoryStoreColumn(IntEnum):
     MARKUP = 0
@@ -110,13 +118,33 @@ class LibraryWindow(Gtk.Box):
             ),
         )
         application.props.download.connect(
-            "images-downloaded", self._update_store_pixbufs
+            "images-downloaded", self._on_images_downloaded
         )
         # Don't make expectations on the order both signals are emitted!!
 
         self._ongoing_store_update = threading.Lock()
         self._abort_pixbufs_update = False
 
+        self._pixbufs_in_flight: Set[str] = set()
+        self._pixbufs_failed: Set[str] = set()
+        # String representation of store paths of items being scaled
+        # or whose scaling failed, only accessed from the main thread
+
+        self._pixbufs_generation = 0
+        # Incremented each time store paths are invalidated, pixbufs
+        # scaled by batches of previous generations are dropped
+
+        self._store_pixbufs_update_source_id: Optional[int] = None
+        self._pixbufs_visible_range: Optional[Tuple[int, int]] = None
+        # Only visible items get their image scaled, thus pixbufs are
+        # updated each time the visible range of the view may change
+        self.directory_view.get_vadjustment().connect(
+            "value-changed", self._schedule_store_pixbufs_update
+        )
+        self.directory_view.connect(
+            "size-allocate", self._on_directory_view_size_allocate
+        )
+
     def _init_default_images(self):
         self._default_images = {
             DirectoryItemType.ALBUM: default_image_pixbuf(
@@ -165,19 +193,17 @@ class LibraryWindow(Gtk.Box):
         pixbuf = self._default_images[type]
 
         if artist_name is not None:
-            elided_escaped_name = GLib.markup_escape_text(elide_maybe(model.name))
-            elided_escaped_artist_name = GLib.markup_escape_text(
-                elide_maybe(artist_name)
-            )
+            elided_escaped_name = elide_and_escape_markup(model.name)
+            elided_escaped_artist_name = elide_and_escape_markup(artist_name)
 
-            escaped_name = GLib.markup_escape_text(model.name)
-            escaped_artist_name = GLib.markup_escape_text(artist_name)
+            escaped_name = escape_markup(model.name)
+            escaped_artist_name = escape_markup(artist_name)
 
             markup_text = f"<b>{elided_escaped_name}</b>\n{elided_escaped_artist_name}"
             tooltip_text = f"<b>{escaped_name}</b>\n{escaped_artist_name}"
         else:
-            escaped_name = GLib.markup_escape_text(model.name)
-            elided_escaped_name = GLib.markup_escape_text(elide_maybe(model.name))
+            escaped_name = escape_markup(model.name)
+            elided_escaped_name = elide_and_escape_markup(model.name)
             markup_text = f"<b>{elided_escaped_name}</b>"
             tooltip_text = f"{escaped_name}"
 
@@ -199,6 +225,7 @@ class LibraryWindow(Gtk.Box):
 
             self.props.filtering_text = stripped
             self.props.filtered_directory_store.refilter()
+            self._schedule_store_pixbufs_update()
 
     def _filter_row(
         self,
@@ -262,15 +289,21 @@ class LibraryWindow(Gtk.Box):
 
             image_uris: List[Path] = []
 
-            if self._ongoing_store_update.locked():
-                self._abort_pixbufs_update = True
-                LOGGER.info("Pixbufs update thread has been requested to abort...")
+            self._abort_store_pixbufs_update()
 
             with self._ongoing_store_update:
                 self._abort_pixbufs_update = False
-                store = self.props.filtered_directory_store.get_model()
+                self._pixbufs_failed.clear()
+                filtered_store = self.props.filtered_directory_store
+                store = filtered_store.get_model()
+
+                self.directory_view.set_model(None)
+                # Detach model from view while filling the store to
+                # avoid view updates on each row insertion
+
                 store.clear()
 
+                columns = [column.value for column in DirectoryStoreColumn]
                 for source, item_type in [
                     (directory.albums, DirectoryItemType.ALBUM),
                     (directory.directories, DirectoryItemType.DIRECTORY),
@@ -278,11 +311,15 @@ class LibraryWindow(Gtk.Box):
                     (directory.tracks, DirectoryItemType.TRACK),
                 ]:
                     for model in source:
-                        store.append(self._build_store_item(model, item_type))
+                        store.insert_with_valuesv(
+                            -1, columns, self._build_store_item(model, item_type)
+                        )
 
                         if model.find_property("image_uri"):
                             image_uris.append(model.get_property("image_uri"))
 
+                self.directory_view.set_model(filtered_store)
+
             if len(image_uris) > 0:
                 LOGGER.debug(
                     f"Found {len(image_uris)} images to fetch after directory store update"
@@ -291,33 +328,158 @@ class LibraryWindow(Gtk.Box):
                     "fetch-images", GLib.Variant("as", image_uris)
                 )
 
+            self._schedule_store_pixbufs_update()
+
         self._hide_progress_box()
 
-    def _update_store_pixbufs(
-        self, _1: Optional[GObject.GObject] = None, *, force: bool = False
-    ) -> None:
+    def _abort_store_pixbufs_update(self) -> None:
+        self._pixbufs_generation += 1
+        self._pixbufs_in_flight.clear()
+        # Queued batches won't run and ongoing one won't deliver its
+        # pixbufs
+
         if self._ongoing_store_update.locked():
             self._abort_pixbufs_update = True
             LOGGER.info("Pixbufs update thread has been requested to abort...")
 
+    def _on_images_downloaded(self, _1: GObject.GObject) -> None:
+        self._pixbufs_failed.clear()
+        # Scaling may have failed on partially downloaded files
+        self._update_store_pixbufs()
+
+    def _schedule_store_pixbufs_update(self, *args) -> None:
+        if self._store_pixbufs_update_source_id is not None:
+            return
+
+        self._store_pixbufs_update_source_id = GLib.timeout_add(
+            PIXBUFS_UPDATE_DELAY, self._on_store_pixbufs_update_timeout
+        )
+
+    def _on_directory_view_size_allocate(
+        self, _1: Gtk.Widget, _2: Gdk.Rectangle
+    ) -> None:
+        if self._get_visible_range_indices() == self._pixbufs_visible_range:
+            # Setting a pixbuf may trigger a new allocation of the view
+            return
+
+        self._schedule_store_pixbufs_update()
+
+    def _on_store_pixbufs_update_timeout(self) -> bool:
+        self._store_pixbufs_update_source_id = None
+        self._update_store_pixbufs()
+        return False
+
+    def _reset_store_pixbufs(self) -> None:
+        store = self.props.filtered_directory_store.get_model()
+        store_iter = store.get_iter_first()
+        while store_iter is not None:
+            raw_library_item_type = store.get_value(
+                store_iter, DirectoryStoreColumn.TYPE
+            )
+            default_image = self._default_images[
+                DirectoryItemType(raw_library_item_type)
+            ]
+            store.set_value(store_iter, DirectoryStoreColumn.PIXBUF, default_image)
+            store_iter = store.iter_next(store_iter)
+
+    def _get_visible_range_indices(self) -> Optional[Tuple[int, int]]:
+        visible_range = self.directory_view.get_visible_range()
+        if visible_range is None:
+            return None
+
+        start_path, end_path = visible_range
+        return start_path.get_indices()[0], end_path.get_indices()[0]
+
+    def _collect_visible_pixbufs_to_scale(
+        self,
+    ) -> List[Tuple[Gtk.TreePath, str]]:
+        visible_range = self._get_visible_range_indices()
+        self._pixbufs_visible_range = visible_range
+        if visible_range is None:
+            return []
+
+        start_index, end_index = visible_range
+        filtered_store = self.props.filtered_directory_store
+        store = filtered_store.get_model()
+        pixbufs_to_scale: List[Tuple[Gtk.TreePath, str]] = []
+        for index in range(start_index, end_index + 1):
+            path = filtered_store.convert_path_to_child_path(
+                Gtk.TreePath.new_from_indices([index])
+            )
+            if path is None:
+                continue
+
+            path_key = path.to_string()
+            if path_key in self._pixbufs_in_flight or path_key in self._pixbufs_failed:
+                continue
+
+            image_path, current_pixbuf, raw_library_item_type = store.get(
+                store.get_iter(path),
+                DirectoryStoreColumn.IMAGE_FILE_PATH,
+                DirectoryStoreColumn.PIXBUF,
+                DirectoryStoreColumn.TYPE,
+            )
+            library_item_type = DirectoryItemType(raw_library_item_type)
+            default_image = self._default_images[library_item_type]
+            if (
+                library_item_type
+                in (
+                    DirectoryItemType.ALBUM,
+                    DirectoryItemType.DIRECTORY,
+                    DirectoryItemType.TRACK,
+                )
+                and image_path
+                and current_pixbuf == default_image
+                and Path(image_path).exists()
+            ):
+                # Image files not downloaded yet will be handled once
+                # images-downloaded is emitted
+                pixbufs_to_scale.append((path, image_path))
+                self._pixbufs_in_flight.add(path_key)
+
+        return pixbufs_to_scale
+
+    def _update_store_pixbufs(self, *, force: bool = False) -> None:
+        if force:
+            self._abort_store_pixbufs_update()
+
             with self._ongoing_store_update:
                 self._abort_pixbufs_update = False
 
+            self._reset_store_pixbufs()
+            self._pixbufs_failed.clear()
+
+        pixbufs_to_scale = self._collect_visible_pixbufs_to_scale()
+        # Items already being scaled aren't collected again, thus the
+        # new batch is queued behind the ongoing one instead of
+        # aborting it
+        if len(pixbufs_to_scale) == 0:
+            return
+
         thread = threading.Thread(
             target=self._start_store_pixbufs_update_task,
             name="ImagesThread",
-            kwargs={"force": force},
+            args=(pixbufs_to_scale, self._pixbufs_generation),
             daemon=True,
         )
         thread.start()
 
-    def _start_store_pixbufs_update_task(self, *, force: bool = False) -> None:
+    def _start_store_pixbufs_update_task(
+        self, pixbufs_to_scale: List[Tuple[Gtk.TreePath, str]], generation: int
+    ) -> None:
         with self._ongoing_store_update:
             # Will wait for ongoing store update to finish
 
+            if generation != self._pixbufs_generation:
+                LOGGER.debug("Skipping outdated library store pixbufs update")
+                return
+
             image_size = self.image_size
 
-            LOGGER.debug(f"Updating library store pixbufs with size {image_size}...")
+            LOGGER.debug(
+                f"Updating {len(pixbufs_to_scale)} library store pixbufs "
+                f"with size {image_size}..."
+            )
 
             store = self.props.filtered_directory_store.get_model()
             pixbuf_to_set: queue.Queue = queue.Queue()
@@ -325,51 +487,63 @@ class LibraryWindow(Gtk.Box):
             def update_item_at() -> bool:
                 try:
                     data = pixbuf_to_set.get(block=False)
-                    path, pixbuf = data
+                    path, image_path, pixbuf = data
+                    if generation != self._pixbufs_generation:
+                        # store has been refilled since paths were collected
+                        LOGGER.debug(f"Skipping outdated pixbuf of row {path}")
+                        return False
+
                     store_iter = store.get_iter(path)
+                    current_image_path = store.get_value(
+                        store_iter, DirectoryStoreColumn.IMAGE_FILE_PATH
+                    )
+                    if current_image_path != image_path:
+                        LOGGER.debug(f"Skipping outdated pixbuf of row {path}")
+                        return False
+
+                    path_key = path.to_string()
+                    self._pixbufs_in_flight.discard(path_key)
+                    if pixbuf is None:
+                        self._pixbufs_failed.add(path_key)
+                        return False
+
                     store.set_value(store_iter, DirectoryStoreColumn.PIXBUF, pixbuf)
-                except queue.Empty:
+                except (queue.Empty, ValueError):
                     pass
                 except Exception as e:
                     LOGGER.warning("Failed to set pixbuf", exc_info=e)
 
                 return False
 
-            store_iter = store.get_iter_first()
-            while store_iter is not None:
+            with ThreadPoolExecutor(
+                max_workers=os.cpu_count(), thread_name_prefix="ImagesScaling"
+            ) as executor:
+                futures = {
+                    executor.submit(
+                        scale_album_image,
+                        image_path,
+                        max_size=image_size,
+                        disk_cache=True,
+                    ): (path, image_path)
+                    for path, image_path in pixbufs_to_scale
+                }
+                for future in as_completed(futures):
+                    if self._abort_pixbufs_update:
+                        break
+
+                    path, image_path = futures[future]
+                    scaled_pixbuf = future.result()
+                    # None is kept to mark failures, the row already
+                    # holds the default image
+                    pixbuf_to_set.put((path, image_path, scaled_pixbuf))
+                    GLib.idle_add(update_item_at)
+
                 if self._abort_pixbufs_update:
                     LOGGER.debug("Aborting pixbuf update")
+                    for pending in futures:
+                        pending.cancel()
                     while not pixbuf_to_set.empty():
                         pixbuf_to_set.get(block=False)
-                    break
-
-                image_path, current_pixbuf, raw_library_item_type = store.get(
-                    store_iter,
-                    DirectoryStoreColumn.IMAGE_FILE_PATH,
-                    DirectoryStoreColumn.PIXBUF,
-                    DirectoryStoreColumn.TYPE,
-                )
-                library_item_type = DirectoryItemType(raw_library_item_type)
-                default_image = self._default_images[library_item_type]
-                path = store.get_path(store_iter)
-                scaled_pixbuf: Pixbuf = default_image
-                if library_item_type in (
-                    DirectoryItemType.ALBUM,
-                    DirectoryItemType.DIRECTORY,
-                    DirectoryItemType.TRACK,
-                ):
-                    if image_path:
-                        if force or current_pixbuf == default_image:
-                            _scaled_pixbuf = scale_album_image(
-                                image_path,
-                                max_size=image_size,
-                            )
-                            if _scaled_pixbuf is not None:
-                                scaled_pixbuf = _scaled_pixbuf
-
-                pixbuf_to_set.put((path, scaled_pixbuf))
-                GLib.idle_add(update_item_at)
-                store_iter = store.iter_next(store_iter)
 
             LOGGER.debug("Finished update of library store pixbufs")
 
@@ -10,7 +10,11 @@ from argos.model import PlaybackState
 from argos.widgets.playingboxemptytracklistbox import PlayingBoxEmptyTracklistBox
 from argos.widgets.tracklengthbox import TrackLengthBox
 from argos.widgets.tracklistbox import TracklistBox
-from argos.widgets.utils import default_image_pixbuf, scale_album_image
+from argos.widgets.utils import (
+    default_image_pixbuf,
+    escape_markup,
+    scale_album_image,
+)
 from argos.widgets.volumebutton import VolumeButton
 
 _ = gettext.gettext
@@ -19,6 +23,9 @@ LOGGER = logging.getLogger(__name__)
 
 TRACK_IMAGE_SIZE = 80
 
+_TRACK_NAME_MARKUP = """<span size="xx-large"><b>{}</b></span>"""
+_ARTIST_NAME_MARKUP = """<span size="x-large">{}</span>"""
+
 
 class TracklistStoreColumns(IntEnum):
     TLID = 0
@@ -190,31 +197,37 @@ class PlayingBox(Gtk.Box):
         self.playing_track_image.show_now()
 
     def _update_track_name_label(self, track_name: Optional[str] = None) -> None:
+        track_name_text = (
+            _TRACK_NAME_MARKUP.format(escape_markup(track_name)) if track_name else ""
+        )
+        if self.track_name_label.get_label() == track_name_text:
+            return
+
+        self.track_name_label.set_markup(track_name_text)
         if track_name:
-            safe_track_name = GLib.markup_escape_text(track_name)
-            track_name_text = (
-                f"""<span size="xx-large"><b>{safe_track_name}</b></span>"""
-            )
-            self.track_name_label.set_markup(track_name_text)
             if not self._disable_tooltips:
                 self.track_name_label.set_has_tooltip(True)
                 self.track_name_label.set_tooltip_text(track_name)
         else:
-            self.track_name_label.set_markup("")
             self.track_name_label.set_has_tooltip(False)
 
         self.track_name_label.show_now()
 
     def _update_artist_name_label(self, artist_name: Optional[str] = None) -> None:
+        artist_name_text = (
+            _ARTIST_NAME_MARKUP.format(escape_markup(artist_name))
+            if artist_name
+            else ""
+        )
+        if self.artist_name_label.get_label() == artist_name_text:
+            return
+
+        self.artist_name_label.set_markup(artist_name_text)
         if artist_name:
-            safe_artist_name = GLib.markup_escape_text(artist_name)
-            artist_name_text = f"""<span size="x-large">{safe_artist_name}</span>"""
-            self.artist_name_label.set_markup(artist_name_text)
             if not self._disable_tooltips:
                 self.artist_name_label.set_has_tooltip(True)
                 self.artist_name_label.set_tooltip_text(artist_name)
         else:
-            self.artist_name_label.set_markup("")
             self.artist_name_label.set_has_tooltip(False)
 
         self.artist_name_label.show_now()
@@ -43,7 +43,7 @@ class PlaylistTrackBox(Gtk.Box):
 
         self.track_name_label.set_text(track_name)
         self.track_name_label.set_tooltip_markup(GLib.markup_escape_text(track_name))
-        track_details = ", ".join(filter(lambda s: s, [artist_name, album_name]))
+        track_details = ", ".join(filter(None, (artist_name, album_name)))
         self.track_details_label.set_text(track_details)
         self.track_details_label.set_tooltip_markup(
             GLib.markup_escape_text(track_details)
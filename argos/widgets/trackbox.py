@@ -1,10 +1,11 @@
 import logging
 from typing import Optional
 
-from gi.repository import GLib, GObject, Gtk
+from gi.repository import GObject, Gtk
 
 from argos.model import AlbumModel, TrackModel
 from argos.utils import ms_to_text
+from argos.widgets.utils import escape_markup
 
 LOGGER = logging.getLogger(__name__)
 
@@ -45,12 +46,10 @@ class TrackBox(Gtk.Box):
         track_length = ms_to_text(track.length) if track.length else ""
 
         self.track_name_label.set_text(track_name)
-        self.track_name_label.set_tooltip_markup(GLib.markup_escape_text(track_name))
-        track_details = ", ".join(filter(lambda s: s, [artist_name, album_name]))
+        self.track_name_label.set_tooltip_markup(escape_markup(track_name))
+        track_details = ", ".join(filter(None, (artist_name, album_name)))
         self.track_details_label.set_text(track_details)
-        self.track_details_label.set_tooltip_markup(
-            GLib.markup_escape_text(track_details)
-        )
+        self.track_details_label.set_tooltip_markup(escape_markup(track_details))
         self.track_length_label.set_text(track_length)
 
         track_no = str(track.track_no) if track.track_no != -1 else ""
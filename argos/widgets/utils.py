@@ -1,15 +1,17 @@
 import datetime
 import gettext
+import hashlib
 import logging
 from functools import lru_cache
 from pathlib import Path
 from typing import Callable, Optional, Sequence
 
+import xdg.BaseDirectory  # type: ignore
 from gi.repository import GdkPixbuf, GLib, Gtk
 from gi.repository.GdkPixbuf import Pixbuf
 
 from argos.model import TrackModel
-from argos.utils import compute_target_size, date_to_string
+from argos.utils import compute_target_size, date_to_string, elide_maybe
 
 LOGGER = logging.getLogger(__name__)
 
@@ -26,6 +28,26 @@ def tracks_length(tracks: Sequence[TrackModel]) -> int:
     return length
 
 
+@lru_cache(maxsize=4096)
+def escape_markup(text: str) -> str:
+    return GLib.markup_escape_text(text)
+
+
+@lru_cache(maxsize=4096)
+def elide_and_escape_markup(text: str) -> str:
+    return GLib.markup_escape_text(elide_maybe(text))
+
+
+def _pick_interp_type(source_width: int, target_width: int) -> GdkPixbuf.InterpType:
+    """Choose the cheapest interpolation giving a decent result."""
+    ratio = source_width / max(target_width, 1)
+    if 1 <= ratio < 1.25:
+        return GdkPixbuf.InterpType.NEAREST
+    elif ratio > 2:
+        return GdkPixbuf.InterpType.HYPER
+    return GdkPixbuf.InterpType.BILINEAR
+
+
 def default_image_pixbuf(icon_name: str, max_size: int) -> Pixbuf:
     pixbuf = Gtk.IconTheme.get_default().load_icon(icon_name, max_size, 0)
     original_width, original_height = pixbuf.get_width(), pixbuf.get_height()
@@ -37,30 +59,83 @@ def default_image_pixbuf(icon_name: str, max_size: int) -> Pixbuf:
     if (original_width, original_height) == (width, height):
         return pixbuf
 
-    scaled_pixbuf = pixbuf.scale_simple(width, height, GdkPixbuf.InterpType.BILINEAR)
+    interp_type = _pick_interp_type(original_width, width)
+    scaled_pixbuf = pixbuf.scale_simple(width, height, interp_type)
     return scaled_pixbuf
 
 
+def _thumbnail_path(image_path: Path, size: int) -> Path:
+    """Path where to cache the scaled version of an image."""
+    thumbnail_dir = Path(xdg.BaseDirectory.save_cache_path("argos/thumbnails"))
+    digest = hashlib.sha1(str(image_path).encode()).hexdigest()
+    return thumbnail_dir / f"{digest}_{size}.png"
+
+
+def _load_thumbnail(image_path: Path, thumbnail_path: Path) -> Optional[Pixbuf]:
+    try:
+        if thumbnail_path.stat().st_mtime < Path(image_path).stat().st_mtime:
+            return None
+
+        return Pixbuf.new_from_file(str(thumbnail_path))
+    except (OSError, GLib.Error):
+        return None
+
+
+class _ImageScalingError(Exception):
+    pass
+
+
 @lru_cache
-def scale_album_image(image_path: Path, *, max_size: int) -> Optional[Pixbuf]:
-    pixbuf = None
+def _scale_album_image(image_path: Path, max_size: int, disk_cache: bool) -> Pixbuf:
+    thumbnail_path = _thumbnail_path(image_path, max_size) if disk_cache else None
+    if thumbnail_path is not None:
+        scaled_pixbuf = _load_thumbnail(image_path, thumbnail_path)
+        if scaled_pixbuf is not None:
+            return scaled_pixbuf
+
     try:
-        pixbuf = Pixbuf.new_from_file(str(image_path))
+        scaled_pixbuf = Pixbuf.new_from_file_at_scale(
+            str(image_path), max_size, max_size, True
+        )
+        # Scaling happens while decoding, so that less pixels are read
     except GLib.Error as error:
-        LOGGER.warning(f"Failed to read image at {str(image_path)!r}: {error}")
+        raise _ImageScalingError(str(error))
 
-    if pixbuf is None:
-        return None
+    if scaled_pixbuf is None:
+        raise _ImageScalingError("No image decoded")
+
+    if thumbnail_path is not None:
+        try:
+            scaled_pixbuf.savev(str(thumbnail_path), "png", [], [])
+        except GLib.Error as error:
+            LOGGER.warning(
+                f"Failed to write thumbnail at {str(thumbnail_path)!r}: {error}"
+            )
 
-    width, height = compute_target_size(
-        pixbuf.get_width(),
-        pixbuf.get_height(),
-        max_size=max_size,
-    )
-    scaled_pixbuf = pixbuf.scale_simple(width, height, GdkPixbuf.InterpType.BILINEAR)
     return scaled_pixbuf
 
 
+def scale_album_image(
+    image_path: Path, *, max_size: int, disk_cache: bool = False
+) -> Optional[Pixbuf]:
+    """Scale an image to fit in a square of given size.
+
+    Scaled images are cached in memory; Failures aren't, since image
+    files may still be downloading.
+
+    When ``disk_cache`` is true, the scaled image is also cached on
+    disk. It's meant for the library item images only, whose sizes
+    are fixed by user settings and which are scaled outside of the
+    main thread, since the PNG encoding is synchronous.
+
+    """
+    try:
+        return _scale_album_image(image_path, max_size, disk_cache)
+    except _ImageScalingError as error:
+        LOGGER.warning(f"Failed to read image at {str(image_path)!r}: {error}")
+        return None
+
+
 def set_list_box_header_with_separator(
     row: Gtk.ListBoxRow,
     before: Gtk.ListBoxRow,
@@ -1,6 +1,7 @@
 import gettext
 import logging
-from typing import Optional, Union
+from functools import partial
+from typing import Callable, Dict, Optional, Tuple, Union
 
 from gi.repository import Gdk, Gio, GLib, GObject, Gtk
 
@@ -40,6 +41,9 @@ class ArgosWindow(Gtk.ApplicationWindow):
         self._model = application.props.model
         self._settings: Gio.Settings = application.props.settings
 
+        self._titlebar_state_update_pending = False
+        self._key_actions = self._build_key_actions()
+
         self.props.titlebar = TitleBar(application, window=self)
         self._setup_titlebar(self.props.titlebar)
         self.set_titlebar(self.props.titlebar)
@@ -154,9 +158,17 @@ class ArgosWindow(Gtk.ApplicationWindow):
         _1: GObject.GObject,
         _2: GObject.GParamSpec,
     ) -> None:
-        self._update_titlebar_state()
+        if self._titlebar_state_update_pending:
+            return
+
+        self._titlebar_state_update_pending = True
+        GLib.idle_add(self._update_titlebar_state, priority=GLib.PRIORITY_HIGH_IDLE)
+        # Browsing the library changes both the directory URI and the
+        # visible page of the library stack, only update once
+
+    def _update_titlebar_state(self) -> bool:
+        self._titlebar_state_update_pending = False
 
-    def _update_titlebar_state(self) -> None:
         central_child_name = self.central_view.get_visible_child_name()
 
         if central_child_name == "playing_page":
@@ -174,6 +186,8 @@ class ArgosWindow(Gtk.ApplicationWindow):
         elif central_child_name == "playlists_page":
             self.titlebar.set_state(TitleBarState.FOR_PLAYLISTS_PAGE)
 
+        return False
+
     def _on_title_back_button_clicked(self, _1: Gtk.Button) -> None:
         self.props.library_window.goto_parent_state()
 
@@ -308,62 +322,128 @@ class ArgosWindow(Gtk.ApplicationWindow):
 
         return True
 
-    @Gtk.Template.Callback()
-    def key_press_event_cb(self, widget: Gtk.Widget, event: Gdk.EventKey) -> bool:
+    def _build_key_actions(self) -> Dict[Tuple[int, int], Callable[[], bool]]:
         # See /usr/include/gtk-3.0/gdk/gdkkeysyms.h for key definitions
-        mod1_mask = Gdk.ModifierType.MOD1_MASK
-        control_mask = Gdk.ModifierType.CONTROL_MASK
-        shift_mask = Gdk.ModifierType.SHIFT_MASK
+        mod1_mask = int(Gdk.ModifierType.MOD1_MASK)
+        control_mask = int(Gdk.ModifierType.CONTROL_MASK)
+        shift_mask = int(Gdk.ModifierType.SHIFT_MASK)
         mod1_and_shift_mask = mod1_mask | shift_mask
-        modifiers = event.state & Gtk.accelerator_get_default_mod_mask()
-        keyval = event.keyval
-        if modifiers in [mod1_mask, mod1_and_shift_mask]:
-            if keyval in [Gdk.KEY_1, Gdk.KEY_KP_1]:
-                self.set_central_view_visible_child("playing_page")
-                return True
-            elif keyval in [Gdk.KEY_2, Gdk.KEY_KP_2]:
-                self.set_central_view_visible_child("library_page")
-                return True
-            elif keyval in [Gdk.KEY_3, Gdk.KEY_KP_3]:
-                self.set_central_view_visible_child("playlists_page")
-                return True
-            elif keyval in [Gdk.KEY_Up, Gdk.KEY_KP_Up]:
-                if self.central_view.get_visible_child_name() == "library_page":
-                    self.props.library_window.goto_parent_state()
-                return True
-        elif modifiers == control_mask:
-            if keyval in [Gdk.KEY_space, Gdk.KEY_KP_Space]:
-                self.props.application.activate_action("toggle-playback-state")
-                return True
-            elif keyval == Gdk.KEY_n:
-                self.props.application.activate_action("play-next-track")
-                return True
-            elif keyval == Gdk.KEY_p:
-                self.props.application.activate_action("play-prev-track")
-                return True
-            elif keyval == Gdk.KEY_f:
-                self.props.titlebar.toggle_search_entry_focus_maybe()
-                return True
-            elif keyval == Gdk.KEY_r:
-                self.props.application.activate_action("play-random-tracks")
-                return True
-        elif not modifiers:
-            if keyval == Gdk.KEY_Escape:
-                if self.props.titlebar.search_entry.has_focus():
-                    self.props.titlebar.toggle_search_entry_focus_maybe()
-                    return True
-            elif keyval == Gdk.KEY_F11:
-                if self.props.is_fullscreen:
-                    self.unfullscreen()
-                else:
-                    self.fullscreen()
-                return True
-            elif keyval in [Gdk.KEY_Delete, Gdk.KEY_KP_Delete]:
-                visible_page_name = self.central_view.get_visible_child_name()
-                if visible_page_name == "playing_page":
-                    self.props.playing_box.remove_selected_tracks_from_tracklist()
-                    return True
-                elif visible_page_name == "playlists_page":
-                    self.props.playlists_box.remove_selected_tracks_from_playlist()
-                    return True
+        no_mask = 0
+
+        key_actions: Dict[Tuple[int, int], Callable[[], bool]] = {}
+        for modifiers, keyvals, action in [
+            (
+                (mod1_mask, mod1_and_shift_mask),
+                (Gdk.KEY_1, Gdk.KEY_KP_1),
+                partial(self._show_central_view_child, "playing_page"),
+            ),
+            (
+                (mod1_mask, mod1_and_shift_mask),
+                (Gdk.KEY_2, Gdk.KEY_KP_2),
+                partial(self._show_central_view_child, "library_page"),
+            ),
+            (
+                (mod1_mask, mod1_and_shift_mask),
+                (Gdk.KEY_3, Gdk.KEY_KP_3),
+                partial(self._show_central_view_child, "playlists_page"),
+            ),
+            (
+                (mod1_mask, mod1_and_shift_mask),
+                (Gdk.KEY_Up, Gdk.KEY_KP_Up),
+                self._goto_library_parent_state,
+            ),
+            (
+                (control_mask,),
+                (Gdk.KEY_space, Gdk.KEY_KP_Space),
+                partial(self._activate_application_action, "toggle-playback-state"),
+            ),
+            (
+                (control_mask,),
+                (Gdk.KEY_n,),
+                partial(self._activate_application_action, "play-next-track"),
+            ),
+            (
+                (control_mask,),
+                (Gdk.KEY_p,),
+                partial(self._activate_application_action, "play-prev-track"),
+            ),
+            (
+                (control_mask,),
+                (Gdk.KEY_f,),
+                self._toggle_search_entry_focus,
+            ),
+            (
+                (control_mask,),
+                (Gdk.KEY_r,),
+                partial(self._activate_application_action, "play-random-tracks"),
+            ),
+            (
+                (no_mask,),
+                (Gdk.KEY_Escape,),
+                self._unfocus_search_entry,
+            ),
+            (
+                (no_mask,),
+                (Gdk.KEY_F11,),
+                self._toggle_fullscreen,
+            ),
+            (
+                (no_mask,),
+                (Gdk.KEY_Delete, Gdk.KEY_KP_Delete),
+                self._remove_selected_tracks,
+            ),
+        ]:
+            for modifier in modifiers:
+                for keyval in keyvals:
+                    key_actions[(modifier, keyval)] = action
+
+        return key_actions
+
+    def _show_central_view_child(self, name: str) -> bool:
+        self.set_central_view_visible_child(name)
+        return True
+
+    def _goto_library_parent_state(self) -> bool:
+        if self.central_view.get_visible_child_name() == "library_page":
+            self.props.library_window.goto_parent_state()
+        return True
+
+    def _activate_application_action(self, name: str) -> bool:
+        self.props.application.activate_action(name)
+        return True
+
+    def _toggle_search_entry_focus(self) -> bool:
+        self.props.titlebar.toggle_search_entry_focus_maybe()
+        return True
+
+    def _unfocus_search_entry(self) -> bool:
+        if self.props.titlebar.search_entry.has_focus():
+            self.props.titlebar.toggle_search_entry_focus_maybe()
+            return True
+        return False
+
+    def _toggle_fullscreen(self) -> bool:
+        if self.props.is_fullscreen:
+            self.unfullscreen()
+        else:
+            self.fullscreen()
+        return True
+
+    def _remove_selected_tracks(self) -> bool:
+        visible_page_name = self.central_view.get_visible_child_name()
+        if visible_page_name == "playing_page":
+            self.props.playing_box.remove_selected_tracks_from_tracklist()
+            return True
+        elif visible_page_name == "playlists_page":
+            self.props.playlists_box.remove_selected_tracks_from_playlist()
+            return True
         return False
+
+    @Gtk.Template.Callback()
+    def key_press_event_cb(self, widget: Gtk.Widget, event: Gdk.EventKey) -> bool:
+        modifiers = int(event.state & Gtk.accelerator_get_default_mod_mask())
+        action = self._key_actions.get((modifiers, event.keyval))
+        if action is None:
+            return False
+
+        return action()
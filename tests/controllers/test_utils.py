@@ -74,6 +74,33 @@ class TestCallBySlice(unittest.IsolatedAsyncioTestCase):
         results = await call_by_slice(func, params=params, call_size=2)
         self.assertDictEqual(results, {"a": 1, "b": 1})
 
+    async def test_call_by_slice_concurrently(self):
+        params = ["a", "b", "c", "d", "e", "f"]
+        notifier = Mock()
+        results = await call_by_slice(
+            self.func,
+            params=params,
+            call_size=2,
+            max_concurrent_calls=2,
+            notifier=notifier,
+        )
+        self.assertEqual(set(results), set(params))
+        self.assertEqual(set(results.values()), {1, 2, 3})
+        notifier.assert_has_calls([call(2), call(4), call(6)])
+
+    async def test_call_by_slice_concurrently_with_none(self):
+        async def func(param):
+            if "c" in param:
+                return None
+
+            return dict([(p, 1) for p in param])
+
+        params = ["a", "b", "c", "d", "e", "f"]
+        results = await call_by_slice(
+            func, params=params, call_size=2, max_concurrent_calls=3
+        )
+        self.assertDictEqual(results, {"a": 1, "b": 1})
+
 
 class TestParseTracks(unittest.TestCase):
     def test_parse_tracks(self):
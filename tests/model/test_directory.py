@@ -0,0 +1,58 @@
+import unittest
+
+from argos.model import AlbumModel, DirectoryModel
+
+
+def _compare_albums_by_name(a: AlbumModel, b: AlbumModel, _) -> int:
+    if a.props.name < b.props.name:
+        return -1
+    elif a.props.name > b.props.name:
+        return 1
+    return 0
+
+
+class TestDirectoryModel(unittest.TestCase):
+    def setUp(self):
+        self.directory = DirectoryModel(uri="local:directory:", name="Local")
+        self.album_a = AlbumModel(uri="local:album:a", name="b")
+        self.album_b = AlbumModel(uri="local:album:b", name="a")
+
+    def test_get_album_after_splice(self):
+        self.assertIsNone(self.directory.get_album("local:album:a"))
+
+        self.directory.albums.splice(0, 0, [self.album_a, self.album_b])
+
+        self.assertIs(self.directory.get_album("local:album:a"), self.album_a)
+        self.assertIs(self.directory.get_album("local:album:b"), self.album_b)
+        self.assertIsNone(self.directory.get_album("local:album:c"))
+
+    def test_get_album_after_sort(self):
+        self.directory.albums.splice(0, 0, [self.album_a, self.album_b])
+
+        self.directory.sort_albums(_compare_albums_by_name)
+
+        self.assertIs(self.directory.albums.get_item(0), self.album_b)
+        self.assertIs(self.directory.get_album("local:album:a"), self.album_a)
+        self.assertIs(self.directory.get_album("local:album:b"), self.album_b)
+
+    def test_get_album_after_remove_all(self):
+        self.directory.albums.splice(0, 0, [self.album_a, self.album_b])
+
+        self.directory.albums.remove_all()
+
+        self.assertIsNone(self.directory.get_album("local:album:a"))
+        self.assertIsNone(self.directory.get_album("local:album:b"))
+
+    def test_get_album_with_duplicated_uri(self):
+        duplicate = AlbumModel(uri="local:album:a", name="c")
+
+        self.directory.albums.splice(0, 0, [self.album_a, duplicate])
+
+        self.assertIs(self.directory.get_album("local:album:a"), self.album_a)
+
+    def test_get_album_in_subdirectory(self):
+        subdirectory = DirectoryModel(uri="local:directory:sub", name="Sub")
+        subdirectory.albums.splice(0, 0, [self.album_a])
+        self.directory.directories.splice(0, 0, [subdirectory])
+
+        self.assertIs(self.directory.get_album("local:album:a"), self.album_a)
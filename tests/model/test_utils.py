@@ -1,7 +1,19 @@
 import logging
 import unittest
+from unittest.mock import patch
 
-from argos.model.utils import PlaybackState
+from argos.model.utils import PlaybackState, WithThreadSafePropertySetter
+
+
+class _PropertiesHolder(WithThreadSafePropertySetter):
+    def __init__(self, **properties):
+        self.properties = properties
+
+    def get_property(self, name):
+        return self.properties[name]
+
+    def set_property(self, name, value):
+        self.properties[name] = value
 
 
 class TestPlaybackState(unittest.TestCase):
@@ -22,3 +34,43 @@ class TestPlaybackState(unittest.TestCase):
         self.assertEqual(
             logs.output, ["ERROR:argos.model.utils:Unexpected state 'Playing'"]
         )
+
+
+class TestSetPropertiesInGtkThread(unittest.TestCase):
+    @patch("argos.model.utils.GLib.idle_add")
+    def test_single_idle_call(self, idle_add):
+        holder = _PropertiesHolder(consume=False, random=False, repeat=False)
+
+        holder.set_properties_in_gtk_thread({"consume": True, "random": True})
+
+        idle_add.assert_called_once()
+        (wrapped_setter,) = idle_add.call_args.args
+        self.assertEqual(
+            holder.properties, {"consume": False, "random": False, "repeat": False}
+        )
+
+        wrapped_setter()
+        self.assertEqual(
+            holder.properties, {"consume": True, "random": True, "repeat": False}
+        )
+
+    @patch("argos.model.utils.GLib.idle_add")
+    def test_skip_equal_values(self, idle_add):
+        holder = _PropertiesHolder(consume=True, random=False)
+
+        holder.set_properties_in_gtk_thread({"consume": True, "random": False})
+
+        idle_add.assert_not_called()
+
+    @patch("argos.model.utils.GLib.idle_add")
+    def test_skip_values_equal_when_idle(self, idle_add):
+        holder = _PropertiesHolder(consume=False, random=False)
+
+        holder.set_properties_in_gtk_thread({"consume": True, "random": True})
+        (wrapped_setter,) = idle_add.call_args.args
+        holder.properties["random"] = True
+
+        with patch.object(holder, "set_property") as set_property:
+            wrapped_setter()
+
+        set_property.assert_called_once_with("consume", True)
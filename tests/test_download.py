@@ -182,3 +182,23 @@ class TestImageDownloaderWithTestServer(AioHTTPTestCase):
                 call("/local/b23fb74538aa914239bde443f7343633-220x220.jpeg"),
             ]
         )
+
+    async def test_fetch_images_ignores_duplicates(self):
+        self.downloader.fetch_image = AsyncMock()
+        await self.downloader.fetch_images(
+            [
+                "/local/b23fb74538aa914239bde443f7343632-220x220.jpeg",
+                "",
+                "/local/b23fb74538aa914239bde443f7343633-220x220.jpeg",
+                "/local/b23fb74538aa914239bde443f7343632-220x220.jpeg",
+            ]
+        )
+        await asyncio.sleep(0)
+
+        self.downloader.fetch_image.assert_has_calls(
+            [
+                call("/local/b23fb74538aa914239bde443f7343632-220x220.jpeg"),
+                call("/local/b23fb74538aa914239bde443f7343633-220x220.jpeg"),
+            ]
+        )
+        self.assertEqual(self.downloader.fetch_image.call_count, 2)